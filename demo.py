@@ -8,16 +8,24 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from task_agent.task import Task, TaskStatus, Workflow
+from task_agent.task import Task, TaskStatus, Workflow, STATUS_LABELS
 from task_agent.paper import Paper, PaperManager
 from task_agent.document import DocumentGenerator
 
+# Banner strings built once instead of on every print
+BAR = "=" * 70
+TITLE_BANNER = "\n".join([
+    "╔" + "═" * 68 + "╗",
+    "║" + " " * 15 + "Task Agent - Feature Demonstration" + " " * 19 + "║",
+    "╚" + "═" * 68 + "╝",
+])
+
 
 def demo_task_decomposition():
     """Demo task decomposition structure"""
-    print("=" * 70)
+    print(BAR)
     print("Demo: Task Decomposition")
-    print("=" * 70)
+    print(BAR)
     print()
     
     # Simulated task decomposition
@@ -44,15 +52,15 @@ def demo_task_decomposition():
     for i, task in enumerate(tasks, 1):
         print(f"{i}. {task.title}")
         print(f"   Description: {task.description}")
-        print(f"   Status: {task.status.value}")
+        print(f"   Status: {STATUS_LABELS[task.status]}")
         print()
 
 
 def demo_paper_management():
     """Demo paper management"""
-    print("=" * 70)
+    print(BAR)
     print("Demo: Paper Management")
-    print("=" * 70)
+    print(BAR)
     print()
     
     paper_manager = PaperManager(papers_dir="output/papers")
@@ -82,9 +90,8 @@ def demo_paper_management():
         )
     ]
     
-    for paper in papers:
-        paper_manager.add_paper(paper)
-    
+    paper_manager.add_papers(papers)
+
     print(f"Added {len(papers)} papers to the collection")
     print()
     print("Paper Collection Summary:")
@@ -100,9 +107,9 @@ def demo_paper_management():
 
 def demo_document_generation():
     """Demo document generation"""
-    print("=" * 70)
+    print(BAR)
     print("Demo: Document Generation")
-    print("=" * 70)
+    print(BAR)
     print()
     
     doc_gen = DocumentGenerator(output_dir="output/generated")
@@ -187,9 +194,9 @@ on addressing current limitations and ensuring equitable access to these technol
 
 def demo_workflow_execution():
     """Demo workflow execution"""
-    print("=" * 70)
+    print(BAR)
     print("Demo: Workflow Execution")
-    print("=" * 70)
+    print(BAR)
     print()
     
     workflow = Workflow(
@@ -216,14 +223,14 @@ def demo_workflow_execution():
     # Simulate execution
     for i, task in enumerate(workflow.tasks, 1):
         print(f"\n{i}. {task.title}")
-        print(f"   Status: {task.status.value} → ", end="")
+        print(f"   Status: {STATUS_LABELS[task.status]} → ", end="")
         
         # Simulate execution
         task.status = TaskStatus.IN_PROGRESS
-        print(f"{task.status.value} → ", end="")
+        print(f"{STATUS_LABELS[task.status]} → ", end="")
         
         task.status = TaskStatus.COMPLETED
-        print(f"{task.status.value}")
+        print(f"{STATUS_LABELS[task.status]}")
     
     print()
     print(f"Workflow Status: {'Complete' if workflow.is_complete() else 'In Progress'}")
@@ -233,22 +240,22 @@ def demo_workflow_execution():
     print(f"\nWorkflow saved to: output/demo_workflow.json")
 
 
+# Static demo registry, hoisted so main() only references it
+DEMOS = (
+    ("Task Decomposition", demo_task_decomposition),
+    ("Paper Management", demo_paper_management),
+    ("Document Generation", demo_document_generation),
+    ("Workflow Execution", demo_workflow_execution),
+)
+
+
 def main():
     """Run all demos"""
     print()
-    print("╔" + "═" * 68 + "╗")
-    print("║" + " " * 15 + "Task Agent - Feature Demonstration" + " " * 19 + "║")
-    print("╚" + "═" * 68 + "╝")
+    print(TITLE_BANNER)
     print()
     
-    demos = [
-        ("Task Decomposition", demo_task_decomposition),
-        ("Paper Management", demo_paper_management),
-        ("Document Generation", demo_document_generation),
-        ("Workflow Execution", demo_workflow_execution),
-    ]
-    
-    for i, (name, demo_func) in enumerate(demos, 1):
+    for i, (name, demo_func) in enumerate(DEMOS, 1):
         if i > 1:
             input("\nPress Enter to continue to next demo...")
             print()
@@ -256,9 +263,9 @@ def main():
         demo_func()
     
     print()
-    print("=" * 70)
+    print(BAR)
     print("Demo Complete!")
-    print("=" * 70)
+    print(BAR)
     print()
     print("To use the full agent with AI capabilities:")
     print("1. Set up your Gemini API key in .env file")
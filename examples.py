@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from task_agent import TaskAgent, Task, TaskStatus
+from task_agent.task import STATUS_LABELS
 
 
 def example_custom_workflow():
@@ -115,7 +116,7 @@ def example_task_decomposition():
     for i, task in enumerate(subtasks, 1):
         print(f"\n{i}. {task.title}")
         print(f"   Description: {task.description}")
-        print(f"   Status: {task.status.value}")
+        print(f"   Status: {STATUS_LABELS[task.status]}")
 
 
 def main():
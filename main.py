@@ -12,13 +12,24 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from task_agent import TaskAgent
 
+# Banner string built once instead of on every print
+BAR = "=" * 70
+
+# Static example topics, hoisted so main() only references them
+EXAMPLE_TOPICS = (
+    "Machine Learning in Healthcare",
+    "Quantum Computing Applications",
+    "Climate Change Adaptation Strategies",
+    "Blockchain Technology in Supply Chain"
+)
+
 
 def main():
     """Main function demonstrating Task Agent usage"""
     
-    print("=" * 70)
+    print(BAR)
     print("Task Agent - AI-Powered Task Decomposition and Execution")
-    print("=" * 70)
+    print(BAR)
     print()
     
     # Initialize agent
@@ -35,39 +46,31 @@ def main():
         return
     
     # Get topic from user
-    print("=" * 70)
+    print(BAR)
     print("Literature Review Generator")
-    print("=" * 70)
+    print(BAR)
     print()
     
-    # Example topics
-    example_topics = [
-        "Machine Learning in Healthcare",
-        "Quantum Computing Applications",
-        "Climate Change Adaptation Strategies",
-        "Blockchain Technology in Supply Chain"
-    ]
-    
     print("Example topics:")
-    for i, topic in enumerate(example_topics, 1):
+    for i, topic in enumerate(EXAMPLE_TOPICS, 1):
         print(f"  {i}. {topic}")
     print()
-    
+
     # Get user input
     choice = input("Enter a number (1-4) or type your own topic: ").strip()
-    
+
     if choice.isdigit() and 1 <= int(choice) <= 4:
-        topic = example_topics[int(choice) - 1]
+        topic = EXAMPLE_TOPICS[int(choice) - 1]
     else:
-        topic = choice if choice else example_topics[0]
+        topic = choice if choice else EXAMPLE_TOPICS[0]
     
     print(f"\n✓ Selected topic: {topic}")
     print()
     
     # Create and run literature review workflow
-    print("=" * 70)
+    print(BAR)
     print("Starting Literature Review Workflow")
-    print("=" * 70)
+    print(BAR)
     print()
     
     try:
@@ -75,19 +78,19 @@ def main():
         
         if success:
             print()
-            print("=" * 70)
+            print(BAR)
             print("✓ Literature Review Workflow Completed Successfully!")
-            print("=" * 70)
+            print(BAR)
             print()
             print("Generated files can be found in: output/generated/")
             print("Paper metadata: output/papers/papers_metadata.json")
             print("Execution log: output/logs/execution.log")
-            print("=" * 70)
+            print(BAR)
         else:
             print()
-            print("=" * 70)
+            print(BAR)
             print("✗ Workflow failed or was incomplete")
-            print("=" * 70)
+            print(BAR)
             print()
             print("Check output/logs/execution.log for details")
             
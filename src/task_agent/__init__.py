@@ -5,7 +5,17 @@ Task Agent - AI-powered task decomposition and execution system
 __version__ = "1.0.0"
 __author__ = "Task Agent Team"
 
-from .agent import TaskAgent
-from .task import Task, TaskStatus
-
 __all__ = ['TaskAgent', 'Task', 'TaskStatus']
+
+
+def __getattr__(name):
+    # PEP 562 lazy imports: TaskAgent pulls in the Gemini SDK and the
+    # document backends, so scripts that only use tasks or papers should
+    # not pay that import cost
+    if name == 'TaskAgent':
+        from .agent import TaskAgent
+        return TaskAgent
+    if name in ('Task', 'TaskStatus'):
+        from . import task
+        return getattr(task, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,29 +3,60 @@ Main Task Agent - AI-powered task decomposition and execution
 """
 
 import os
+import re
+import atexit
+import asyncio
 import logging
+import logging.handlers
 import yaml
+
+try:
+    # libyaml C extension; silently absent on some installs
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping
 from datetime import datetime
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+from . import jsonio
 from .gemini_client import GeminiClient
 from .task import Task, TaskStatus, Workflow
 from .document import DocumentGenerator
 from .paper import PaperManager, Paper
+from .cache import disk_memoize
 
 # Setup logging
 def setup_logging(log_file: str = "output/logs/execution.log"):
     """Setup logging configuration"""
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
+    fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+    # Buffer file records in memory and flush in bulk, so chatty INFO
+    # logging issues one write per batch instead of one per record;
+    # errors still flush immediately and atexit drains the tail
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # basicConfig only formats the handlers it is handed, and flushing a
+    # MemoryHandler formats with the target's own formatter - so the
+    # file handler needs it set explicitly
+    file_handler.setFormatter(logging.Formatter(fmt))
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    atexit.register(memory_handler.flush)
+
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=fmt,
         handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
+            memory_handler,
             logging.StreamHandler()
         ]
     )
@@ -33,6 +64,90 @@ def setup_logging(log_file: str = "output/logs/execution.log"):
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Numbered subtask lines like "1. Title: description" or "2) Title";
+# the description after the colon is optional
+_SUBTASK_RE = re.compile(r'^\s*(\d+)[.)]\s+([^:]+?)(?::\s*(.*))?$')
+
+# Invariant prompt blocks hoisted to module scope so per-call prompt
+# construction only interpolates the dynamic pieces
+_DECOMPOSE_INSTRUCTIONS = """For a literature review task, typical steps include:
+1. Collect relevant papers (search and identify)
+2. Wait for user to download and upload papers
+3. Read and analyze uploaded papers
+4. Create an outline/structure
+5. Write sections one by one
+6. Review and refine
+
+Provide a numbered list of subtasks in the following format:
+1. [Task Title]: [Detailed description]
+2. [Task Title]: [Detailed description]
+...
+
+Keep each subtask focused and actionable."""
+
+_COLLECTION_INSTRUCTIONS = """Provide 5-10 relevant paper suggestions with:
+- Title
+- Authors (if known)
+- Year
+- Brief description of relevance
+
+Format as a numbered list."""
+
+_ANALYSIS_INSTRUCTIONS = """Analyze the following research paper and provide:
+1. A brief summary (2-3 sentences)
+2. Key findings (3-5 bullet points)
+3. Relevance to the literature review"""
+
+# Papers per batched analysis call; keeps the combined abstracts well
+# inside the context window
+_ANALYSIS_BATCH_SIZE = 8
+
+_BATCH_ANALYSIS_INSTRUCTIONS = """Analyze each of the research papers below.
+Return ONLY a JSON array with exactly one object per paper, in the same
+order, shaped as:
+{"summary": "2-3 sentence summary", "findings": ["key finding", ...]}
+with 3-5 findings per paper. Do not include any text outside the JSON."""
+
+
+@lru_cache(maxsize=32)
+def _cached_config(config_path: str, mtime_ns: int) -> Mapping[str, Any]:
+    """
+    Parse a config file once per (path, mtime) within the process
+
+    Checks the JSON sidecar before falling back to the YAML parser, and
+    returns a read-only mapping so callers cannot mutate the cached
+    entry. Stale entries self-invalidate because a changed mtime forms a
+    new cache key.
+    """
+    cache_path = Path(f"{config_path}.{mtime_ns}.json")
+
+    if cache_path.exists():
+        config = jsonio.loads(cache_path.read_bytes())
+        logger.info(f"Loaded configuration from cache for {config_path}")
+        return MappingProxyType(config)
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    logger.info(f"Loaded configuration from {config_path}")
+
+    _write_config_sidecar(config_path, cache_path, config)
+    return MappingProxyType(config)
+
+
+def _write_config_sidecar(config_path: str, cache_path: Path, config: Dict[str, Any]):
+    """Atomically write the JSON sidecar and drop stale siblings"""
+    try:
+        base = Path(config_path)
+        for stale in base.parent.glob(f"{base.name}.*.json"):
+            if stale != cache_path:
+                stale.unlink()
+
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        tmp_path.write_bytes(jsonio.dumps_bytes(config, pretty=False))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write config cache: {e}")
+
 
 class TaskAgent:
     """Main agent for task decomposition and execution"""
@@ -62,12 +177,17 @@ class TaskAgent:
         logger.info("TaskAgent initialized successfully")
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
-        """Load configuration from YAML file"""
+        """
+        Load configuration from YAML file
+
+        Parsing is cached at two levels: a module-level LRU keyed by
+        (path, mtime) serves repeat loads within the process, and an
+        mtime-keyed JSON sidecar (<config>.<mtime>.json) serves repeat
+        CLI invocations. Both self-invalidate when the YAML changes.
+        """
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            logger.info(f"Loaded configuration from {config_path}")
-            return config
+            mtime_ns = os.stat(config_path).st_mtime_ns
+            return _cached_config(str(Path(config_path).resolve()), mtime_ns)
         except Exception as e:
             logger.warning(f"Could not load config file: {e}. Using defaults.")
             return {}
@@ -93,40 +213,57 @@ class TaskAgent:
         logger.info(f"Created workflow: {title}")
         return workflow
     
-    def decompose_task(self, main_task: str) -> List[Task]:
+    @disk_memoize(key_extra=lambda self, main_task: self.gemini.model_name,
+                  dumps=lambda tasks: [task.to_dict() for task in tasks],
+                  loads=lambda data: [Task.from_dict(item) for item in data],
+                  semantic_threshold=0.92)
+    def _decompose_with_ai(self, main_task: str) -> List[Task]:
         """
-        Decompose a main task into subtasks using AI
-        
+        Decompose a main task into subtasks with a Gemini call
+
+        Results are memoized on disk keyed by the prompt and model, so
+        repeated runs on the same topic skip the LLM call entirely. API
+        failures propagate to the caller uncached.
+
         Args:
             main_task: Main task description
-            
+
         Returns:
             List of subtasks
         """
-        logger.info(f"Decomposing task: {main_task}")
-        
         prompt = f"""You are a task planning expert. Break down the following task into clear, actionable subtasks.
 
 Main Task: {main_task}
 
-For a literature review task, typical steps include:
-1. Collect relevant papers (search and identify)
-2. Wait for user to download and upload papers
-3. Read and analyze uploaded papers
-4. Create an outline/structure
-5. Write sections one by one
-6. Review and refine
+{_DECOMPOSE_INSTRUCTIONS}"""
 
-Provide a numbered list of subtasks in the following format:
-1. [Task Title]: [Detailed description]
-2. [Task Title]: [Detailed description]
-...
+        response = self.gemini.generate(prompt, temperature=0.7)
+        tasks = self._parse_subtasks(response)
+        if not tasks:
+            # Refusals and prose answers carry no numbered lines; raise
+            # so the degraded outcome is never cached or indexed
+            raise ValueError("Response contained no numbered subtasks")
+        return tasks
 
-Keep each subtask focused and actionable."""
+    def decompose_task(self, main_task: str) -> List[Task]:
+        """
+        Decompose a main task into subtasks using AI
+
+        Falls back to the default literature-review tasks when the API
+        call fails or the response yields no parseable subtasks. The
+        fallback happens outside the memoized path so a degraded
+        outcome never writes the default list into the cache.
+
+        Args:
+            main_task: Main task description
+
+        Returns:
+            List of subtasks
+        """
+        logger.info(f"Decomposing task: {main_task}")
 
         try:
-            response = self.gemini.generate(prompt, temperature=0.7)
-            tasks = self._parse_subtasks(response)
+            tasks = self._decompose_with_ai(main_task)
             logger.info(f"Decomposed into {len(tasks)} subtasks")
             return tasks
         except Exception as e:
@@ -137,35 +274,27 @@ Keep each subtask focused and actionable."""
     def _parse_subtasks(self, response: str) -> List[Task]:
         """Parse AI response into Task objects"""
         tasks = []
-        lines = response.strip().split('\n')
-        
+
         task_num = 1
-        for line in lines:
-            line = line.strip()
-            if not line:
+        for line in response.strip().splitlines():
+            # One C-level match replaces the digit check and the chain of
+            # split calls the old parser ran per line
+            match = _SUBTASK_RE.match(line)
+            if match is None:
                 continue
-            
-            # Try to parse numbered items
-            if line[0].isdigit() and ('. ' in line or ') ' in line):
-                # Remove number prefix
-                parts = line.split(': ', 1)
-                if len(parts) == 2:
-                    title = parts[0].split('. ', 1)[-1].split(') ', 1)[-1]
-                    description = parts[1]
-                else:
-                    # No colon, use whole line as title
-                    title = line.split('. ', 1)[-1].split(') ', 1)[-1]
-                    description = title
-                
-                task = Task(
-                    id=f"task_{task_num}",
-                    title=title,
-                    description=description
-                )
-                tasks.append(task)
-                task_num += 1
-        
-        return tasks if tasks else self._get_default_review_tasks()
+
+            title = match.group(2).strip()
+            description = match.group(3) or title
+
+            task = Task(
+                id=f"task_{task_num}",
+                title=title,
+                description=description
+            )
+            tasks.append(task)
+            task_num += 1
+
+        return tasks
     
     def _get_default_review_tasks(self) -> List[Task]:
         """Get default tasks for literature review"""
@@ -183,35 +312,42 @@ Keep each subtask focused and actionable."""
                  description="Write the complete literature review section by section"),
         ]
     
+    # Routing table: first pattern found in the lowercased title wins.
+    # Substring matching (one precompiled alternation per route) keeps
+    # the original elif chain's semantics, so inflected titles like
+    # "Searching for Papers" or "Reviewing and Refining" still route;
+    # order preserves the chain's priority
+    _ROUTES = (
+        (re.compile(r'collect|search'), '_handle_paper_collection'),
+        (re.compile(r'upload|download'), '_handle_paper_upload'),
+        (re.compile(r'analyze|read'), '_handle_paper_analysis'),
+        (re.compile(r'outline|structure'), '_handle_outline_creation'),
+        (re.compile(r'write|review'), '_handle_writing'),
+    )
+
     def execute_task(self, task: Task) -> bool:
         """
         Execute a single task
-        
+
         Args:
             task: Task to execute
-            
+
         Returns:
             True if task completed successfully
         """
         logger.info(f"Executing task: {task.title}")
         task.status = TaskStatus.IN_PROGRESS
-        
+
         try:
-            # Route to appropriate handler based on task type
-            if "collect" in task.title.lower() or "search" in task.title.lower():
-                result = self._handle_paper_collection(task)
-            elif "upload" in task.title.lower() or "download" in task.title.lower():
-                result = self._handle_paper_upload(task)
-            elif "analyze" in task.title.lower() or "read" in task.title.lower():
-                result = self._handle_paper_analysis(task)
-            elif "outline" in task.title.lower() or "structure" in task.title.lower():
-                result = self._handle_outline_creation(task)
-            elif "write" in task.title.lower() or "review" in task.title.lower():
-                result = self._handle_writing(task)
-            else:
-                # Generic task execution
-                result = self._handle_generic_task(task)
-            
+            # Route to appropriate handler based on task type: lowercase
+            # the title once, then scan the table
+            title = task.title.lower()
+            handler_name = next(
+                (name for pattern, name in self._ROUTES if pattern.search(title)),
+                '_handle_generic_task'
+            )
+            result = getattr(self, handler_name)(task)
+
             task.result = result
             task.status = TaskStatus.COMPLETED
             task.completed_at = datetime.now()
@@ -233,13 +369,7 @@ Keep each subtask focused and actionable."""
         
         prompt = f"""Generate a list of important research papers for a literature review on: {topic}
 
-Provide 5-10 relevant paper suggestions with:
-- Title
-- Authors (if known)
-- Year
-- Brief description of relevance
-
-Format as a numbered list."""
+{_COLLECTION_INSTRUCTIONS}"""
 
         response = self.gemini.generate(prompt)
         task.metadata['suggested_papers'] = response
@@ -271,48 +401,125 @@ Once papers are uploaded, continue to the next task."""
         if not papers:
             return "No papers available for analysis. Please upload papers first."
         
-        # Analyze each paper
+        # Batch the papers into as few Gemini calls as the context allows:
+        # one prompt carrying K abstracts pays the instruction preamble
+        # once and saves K-1 round-trips. A batch whose response does not
+        # parse falls back to the threaded per-paper path.
+        analyses = []
+        for start in range(0, len(papers), _ANALYSIS_BATCH_SIZE):
+            batch = papers[start:start + _ANALYSIS_BATCH_SIZE]
+            batch_analyses = self._analyze_paper_batch(batch)
+            if batch_analyses is None:
+                batch_analyses = self._analyze_papers_individually(batch)
+            analyses.extend(batch_analyses)
+
+        # Collect results and update the paper manager sequentially so the
+        # metadata log is only touched from this thread
         analysis_results = []
-        
-        for paper in papers:
-            prompt = f"""Analyze the following research paper and provide:
-1. A brief summary (2-3 sentences)
-2. Key findings (3-5 bullet points)
-3. Relevance to the literature review
 
-Paper Title: {paper.title}
-Authors: {', '.join(paper.authors) if paper.authors else 'Unknown'}
-Abstract: {paper.abstract if paper.abstract else 'Not available'}
+        for paper, (analysis, key_findings, error) in zip(papers, analyses):
+            if error is not None:
+                logger.error(f"Error analyzing paper {paper.title}: {error}")
+                analysis_results.append(f"### {paper.title}\n\nError analyzing paper: {error}")
+                continue
 
-Provide a concise analysis."""
+            analysis_results.append(f"### {paper.title}\n\n{analysis}")
 
-            try:
-                analysis = self.gemini.generate(prompt)
-                analysis_results.append(f"### {paper.title}\n\n{analysis}")
-                
-                # Update paper with analysis
-                # Extract key findings from analysis
-                key_findings = [line.strip('- ').strip() 
-                               for line in analysis.split('\n') 
-                               if line.strip().startswith('-')]
-                
-                self.paper_manager.update_paper_summary(
-                    paper.title,
-                    analysis,
-                    key_findings[:5]
-                )
-                
-            except Exception as e:
-                logger.error(f"Error analyzing paper {paper.title}: {e}")
-                analysis_results.append(f"### {paper.title}\n\nError analyzing paper: {e}")
+            self.paper_manager.update_paper_summary(
+                paper.title,
+                analysis,
+                key_findings[:5]
+            )
         
         full_analysis = "\n\n".join(analysis_results)
         
         # Save analysis to metadata
         task.metadata['paper_analysis'] = full_analysis
-        
+
         return f"Analyzed {len(papers)} papers.\n\n{full_analysis}"
-    
+
+    def _analyze_paper_batch(self, papers: List[Paper]) -> Optional[List[tuple]]:
+        """
+        Analyze a batch of papers with a single Gemini call
+
+        Returns a list of (analysis, key_findings, error) tuples aligned
+        with the input, or None when the call fails or the response does
+        not parse as one object per paper.
+        """
+        sections = [f"""[{index}] Title: {paper.title}
+Authors: {', '.join(paper.authors) if paper.authors else 'Unknown'}
+Abstract: {paper.abstract if paper.abstract else 'Not available'}"""
+                    for index, paper in enumerate(papers)]
+        prompt = f"{_BATCH_ANALYSIS_INSTRUCTIONS}\n\n" + "\n---\n".join(sections)
+
+        try:
+            response = self.gemini.generate(prompt)
+            text = response.strip()
+            # Models often wrap JSON in a markdown fence despite instructions
+            if text.startswith('```'):
+                text = text.split('\n', 1)[-1].rsplit('```', 1)[0]
+            parsed = jsonio.loads(text)
+        except Exception as e:
+            logger.warning(f"Batched analysis failed, falling back to per-paper calls: {e}")
+            return None
+
+        if not isinstance(parsed, list) or len(parsed) != len(papers):
+            logger.warning("Batched analysis returned an unexpected shape, "
+                           "falling back to per-paper calls")
+            return None
+
+        analyses = []
+        for item in parsed:
+            summary = str(item.get('summary', '')).strip() if isinstance(item, dict) else str(item)
+            findings = [str(f) for f in item.get('findings', [])] if isinstance(item, dict) else []
+            analysis = summary
+            if findings:
+                analysis += "\n\n" + "\n".join(f"- {f}" for f in findings)
+            analyses.append((analysis, findings, None))
+        return analyses
+
+    def _analyze_papers_individually(self, papers: List[Paper]) -> List[tuple]:
+        """
+        Analyze papers with one streamed Gemini call each, in parallel
+
+        Returns (analysis, key_findings, error) tuples aligned with the
+        input papers.
+        """
+        prompts = [f"""{_ANALYSIS_INSTRUCTIONS}
+
+Paper Title: {paper.title}
+Authors: {', '.join(paper.authors) if paper.authors else 'Unknown'}
+Abstract: {paper.abstract if paper.abstract else 'Not available'}
+
+Provide a concise analysis.""" for paper in papers]
+
+        def analyze(prompt: str):
+            # Consume the streamed response chunk by chunk, extracting
+            # bullet findings in the same pass so the text is only
+            # scanned once and parsing overlaps the network receive
+            try:
+                chunks = []
+                key_findings = []
+                tail = ''
+                for chunk in self.gemini.generate_stream(prompt):
+                    chunks.append(chunk)
+                    lines = (tail + chunk).split('\n')
+                    tail = lines.pop()
+                    for line in lines:
+                        if line.strip().startswith('-'):
+                            key_findings.append(line.strip('- ').strip())
+                if tail.strip().startswith('-'):
+                    key_findings.append(tail.strip('- ').strip())
+                return ''.join(chunks), key_findings, None
+            except Exception as e:
+                return None, None, e
+
+        if len(prompts) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(prompts))) as executor:
+                return list(executor.map(analyze, prompts))
+        return [analyze(prompts[0])]
+
+
     def _handle_outline_creation(self, task: Task) -> str:
         """Handle outline creation task"""
         logger.info("Handling outline creation")
@@ -323,12 +530,13 @@ Provide a concise analysis."""
         # Prepare papers summary for context
         papers_context = ""
         if papers:
-            papers_context = "Available papers:\n"
+            lines = ["Available papers:"]
             for paper in papers:
-                papers_context += f"- {paper.title}"
                 if paper.summary:
-                    papers_context += f": {paper.summary[:200]}..."
-                papers_context += "\n"
+                    lines.append(f"- {paper.title}: {paper.summary[:200]}...")
+                else:
+                    lines.append(f"- {paper.title}")
+            papers_context = "\n".join(lines) + "\n"
         
         prompt = f"""Create a comprehensive outline for a literature review on: {topic}
 
@@ -399,16 +607,18 @@ Format in Markdown with proper headings and citations."""
         
         # Generate all formats
         output_files = self.doc_generator.generate_all_formats(review_content, filename)
-        
-        task.metadata['output_files'] = output_files
-        task.metadata['review_content'] = review_content
-        
-        result = f"Literature review completed!\n\n"
-        result += f"Generated files:\n"
-        for format_type, filepath in output_files.items():
-            result += f"- {format_type.upper()}: {filepath}\n"
-        
-        return result
+
+        # Keep only a preview and the markdown path on the task; the full
+        # review lives on disk, so the workflow JSON and the task object
+        # stay small instead of carrying the multi-KB blob around
+        task.result_preview = review_content[:500]
+        task.result_path = output_files['md']
+
+        lines = ["Literature review completed!", "", "Generated files:"]
+        lines.extend(f"- {format_type.upper()}: {filepath}"
+                     for format_type, filepath in output_files.items())
+
+        return "\n".join(lines) + "\n"
     
     def _handle_generic_task(self, task: Task) -> str:
         """Handle generic task execution"""
@@ -427,48 +637,70 @@ Provide a detailed response on how to complete this task or the results of compl
     def run_workflow(self, workflow: Workflow) -> bool:
         """
         Run a complete workflow
-        
+
+        Tasks are grouped into dependency batches (see
+        Workflow.execution_batches); independent tasks within a batch are
+        dispatched concurrently since they are I/O-bound Gemini calls.
+        Workflows without declared dependencies run strictly in order.
+
         Args:
             workflow: Workflow to execute
-            
+
         Returns:
             True if workflow completed successfully
         """
         logger.info(f"Starting workflow: {workflow.title}")
         self.current_workflow = workflow
-        
-        for i, task in enumerate(workflow.tasks):
-            logger.info(f"Task {i+1}/{len(workflow.tasks)}: {task.title}")
-            
-            if task.status == TaskStatus.WAITING_USER:
+
+        task_count = len(workflow.tasks)
+        task_num = 0
+
+        for batch in workflow.execution_batches():
+            auto_tasks = [t for t in batch if t.status != TaskStatus.WAITING_USER]
+            user_tasks = [t for t in batch if t.status == TaskStatus.WAITING_USER]
+
+            for task in batch:
+                task_num += 1
+                logger.info(f"Task {task_num}/{task_count}: {task.title}")
+
+            # Dispatch independent tasks concurrently (I/O-bound API calls)
+            if len(auto_tasks) > 1:
+                with ThreadPoolExecutor(max_workers=len(auto_tasks)) as executor:
+                    results = list(executor.map(self.execute_task, auto_tasks))
+            else:
+                results = [self.execute_task(task) for task in auto_tasks]
+
+            for task, success in zip(auto_tasks, results):
+                if not success:
+                    logger.error(f"Workflow failed at task: {task.title}")
+                    return False
+
+                # Print task result
+                print(f"\n{'='*60}")
+                print(f"TASK COMPLETED: {task.title}")
+                print(f"{'='*60}")
+                if task.result_preview:
+                    print(task.result_preview)
+                    if task.result_path:
+                        print(f"... (full output: {task.result_path})")
+                elif task.result:
+                    print(task.result[:500])  # Print first 500 chars
+                    if len(task.result) > 500:
+                        print("...")
+                print(f"{'='*60}\n")
+
+            for task in user_tasks:
                 logger.info(f"Task requires user action: {task.title}")
                 print(f"\n{'='*60}")
                 print(f"USER ACTION REQUIRED: {task.title}")
                 print(f"{task.description}")
                 print(f"{'='*60}\n")
-                
+
                 # Wait for user to indicate completion
                 input("Press Enter when ready to continue...")
                 task.status = TaskStatus.COMPLETED
                 task.completed_at = datetime.now()
-                continue
-            
-            success = self.execute_task(task)
-            
-            if not success:
-                logger.error(f"Workflow failed at task: {task.title}")
-                return False
-            
-            # Print task result
-            print(f"\n{'='*60}")
-            print(f"TASK COMPLETED: {task.title}")
-            print(f"{'='*60}")
-            if task.result:
-                print(task.result[:500])  # Print first 500 chars
-                if len(task.result) > 500:
-                    print("...")
-            print(f"{'='*60}\n")
-        
+
         logger.info(f"Workflow completed: {workflow.title}")
         
         # Save workflow state
@@ -476,6 +708,22 @@ Provide a detailed response on how to complete this task or the results of compl
         
         return True
     
+    async def run_workflow_async(self, workflow: Workflow) -> bool:
+        """
+        Run a workflow without blocking the event loop
+
+        The blocking Gemini SDK calls are pushed onto a worker thread via
+        asyncio.to_thread, so callers embedding the agent in an asyncio
+        application can run multiple workflows concurrently.
+
+        Args:
+            workflow: Workflow to execute
+
+        Returns:
+            True if workflow completed successfully
+        """
+        return await asyncio.to_thread(self.run_workflow, workflow)
+
     def _save_workflow(self, workflow: Workflow):
         """Save workflow state to file"""
         output_dir = Path(self.config.get('output', {}).get('base_dir', 'output'))
@@ -512,6 +760,18 @@ Provide a detailed response on how to complete this task or the results of compl
         # Run workflow
         return self.run_workflow(workflow)
     
+    async def create_literature_review_async(self, topic: str) -> bool:
+        """
+        Async counterpart of create_literature_review
+
+        Args:
+            topic: Literature review topic
+
+        Returns:
+            True if successful
+        """
+        return await asyncio.to_thread(self.create_literature_review, topic)
+
     def add_papers(self, papers_info: List[Dict[str, Any]]):
         """
         Add papers to the paper manager
@@ -519,8 +779,8 @@ Provide a detailed response on how to complete this task or the results of compl
         Args:
             papers_info: List of paper dictionaries with title, authors, etc.
         """
-        for info in papers_info:
-            paper = Paper(
+        papers = [
+            Paper(
                 title=info.get('title', ''),
                 authors=info.get('authors', []),
                 year=info.get('year'),
@@ -529,6 +789,8 @@ Provide a detailed response on how to complete this task or the results of compl
                 filepath=info.get('filepath'),
                 url=info.get('url')
             )
-            self.paper_manager.add_paper(paper)
-        
+            for info in papers_info
+        ]
+        self.paper_manager.add_papers(papers)
+
         logger.info(f"Added {len(papers_info)} papers")
@@ -0,0 +1,217 @@
+"""
+Persistent on-disk caching utilities
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import functools
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "output/cache"
+DEFAULT_TTL = 24 * 3600
+DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _cache_enabled() -> bool:
+    """Check if result memoization is enabled (TASK_AGENT_CACHE=0 disables)
+
+    Distinct from TASK_AGENT_RESPONSE_CACHE, which opts in to replaying
+    raw Gemini responses (see gemini_client).
+    """
+    return os.getenv("TASK_AGENT_CACHE", "1") != "0"
+
+
+def _cache_key(name: str, extra: Any, args: tuple, kwargs: dict) -> str:
+    """Build a stable SHA-256 key from the call signature"""
+    payload = json.dumps([name, extra, args, kwargs], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _atomic_write(filepath: Path, content: str):
+    """Write a file atomically via a temporary sibling and os.replace"""
+    tmp_path = filepath.with_name(filepath.name + '.tmp')
+    tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, filepath)
+
+
+def _evict_lru(cache_dir: Path, max_cache_bytes: int):
+    """Delete oldest cache entries until the directory fits the size budget"""
+    entries = []
+    total = 0
+    for path in cache_dir.glob('*.json'):
+        if len(path.stem) != 64:  # only hash-named entries, not the index
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+
+    if total <= max_cache_bytes:
+        return
+
+    entries.sort()  # oldest first
+    for _, size, path in entries:
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        if total <= max_cache_bytes:
+            break
+
+
+class SemanticPromptCache:
+    """
+    Map near-duplicate prompts onto existing cache entries
+
+    Users often submit paraphrases of the same topic ("Machine Learning in
+    Healthcare" vs "Machine learning for healthcare"). A small JSON index
+    records each cached prompt and its cache key; lookups normalize the
+    incoming prompt and accept the closest indexed prompt whose similarity
+    ratio clears the threshold.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, threshold: float = 0.92):
+        """
+        Initialize the semantic prompt index
+
+        Args:
+            cache_dir: Directory holding cache entries and the index
+            threshold: Minimum similarity ratio for a match (0.0-1.0)
+        """
+        self.index_file = Path(cache_dir) / "semantic_index.json"
+        self.threshold = threshold
+
+    @staticmethod
+    def _normalize(prompt: str) -> str:
+        """Lowercase and collapse a prompt to its word tokens"""
+        return ' '.join(re.findall(r'\w+', prompt.lower()))
+
+    def _load_index(self) -> dict:
+        if self.index_file.exists():
+            try:
+                return json.loads(self.index_file.read_text(encoding='utf-8'))
+            except Exception as e:
+                logger.warning(f"Could not read semantic index: {e}")
+        return {}
+
+    def lookup(self, prompt: str) -> Optional[str]:
+        """Return the cache key of the most similar indexed prompt, if any"""
+        normalized = self._normalize(prompt)
+        best_key = None
+        best_score = self.threshold
+
+        for indexed, key in self._load_index().items():
+            score = SequenceMatcher(None, normalized, indexed).ratio()
+            if score >= best_score:
+                best_score = score
+                best_key = key
+
+        return best_key
+
+    def store(self, prompt: str, key: str):
+        """Record a prompt and the cache key holding its result"""
+        index = self._load_index()
+        index[self._normalize(prompt)] = key
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(self.index_file, json.dumps(index, ensure_ascii=False))
+        except Exception as e:
+            logger.warning(f"Could not write semantic index: {e}")
+
+
+def disk_memoize(cache_dir: str = DEFAULT_CACHE_DIR,
+                 ttl: int = DEFAULT_TTL,
+                 max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+                 key_extra: Optional[Callable[..., Any]] = None,
+                 dumps: Optional[Callable[[Any], Any]] = None,
+                 loads: Optional[Callable[[Any], Any]] = None,
+                 semantic_threshold: Optional[float] = None):
+    """
+    Memoize a function's results on disk, keyed by a SHA-256 of its arguments
+
+    Results are stored as JSON under cache_dir and reused until the TTL
+    expires. Cached entries are evicted oldest-first once the directory
+    exceeds max_cache_bytes.
+
+    Args:
+        cache_dir: Directory for cache files
+        ttl: Time-to-live for entries in seconds
+        max_cache_bytes: Size budget for the cache directory
+        key_extra: Optional callable receiving the original arguments and
+            returning extra key material (e.g. a model name). When set, the
+            first positional argument is treated as `self` and excluded
+            from the key.
+        dumps: Optional converter from the result to JSON-compatible data
+        loads: Optional converter from JSON data back to the result
+        semantic_threshold: When set, near-duplicate prompts (the first
+            string argument) reuse existing entries via SemanticPromptCache
+
+    Returns:
+        Decorator wrapping the function with the disk cache
+    """
+    semantic = (SemanticPromptCache(cache_dir, semantic_threshold)
+                if semantic_threshold else None)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _cache_enabled():
+                return func(*args, **kwargs)
+
+            if key_extra is not None:
+                extra = key_extra(*args, **kwargs)
+                key_args = args[1:]
+            else:
+                extra = None
+                key_args = args
+
+            key = _cache_key(func.__qualname__, extra, key_args, kwargs)
+            cache_path = Path(cache_dir) / f"{key}.json"
+
+            prompt = key_args[0] if key_args and isinstance(key_args[0], str) else None
+
+            try:
+                if cache_path.exists():
+                    age = time.time() - cache_path.stat().st_mtime
+                    if age < ttl:
+                        data = json.loads(cache_path.read_text(encoding='utf-8'))
+                        logger.info(f"Cache hit for {func.__qualname__}")
+                        return loads(data) if loads else data
+                elif semantic is not None and prompt is not None:
+                    # Exact miss - look for a near-duplicate prompt
+                    near_key = semantic.lookup(prompt)
+                    if near_key:
+                        near_path = Path(cache_dir) / f"{near_key}.json"
+                        if near_path.exists() and time.time() - near_path.stat().st_mtime < ttl:
+                            data = json.loads(near_path.read_text(encoding='utf-8'))
+                            logger.info(f"Semantic cache hit for {func.__qualname__}")
+                            return loads(data) if loads else data
+            except Exception as e:
+                logger.warning(f"Could not read cache entry: {e}")
+
+            result = func(*args, **kwargs)
+
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                data = dumps(result) if dumps else result
+                _atomic_write(cache_path, json.dumps(data, ensure_ascii=False))
+                if semantic is not None and prompt is not None:
+                    semantic.store(prompt, key)
+                _evict_lru(cache_path.parent, max_cache_bytes)
+            except Exception as e:
+                logger.warning(f"Could not write cache entry: {e}")
+
+            return result
+        return wrapper
+    return decorator
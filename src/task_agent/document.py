@@ -4,20 +4,123 @@ Document generation and format conversion utilities
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
-import markdown
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER
+# python-docx and reportlab each cost hundreds of ms to initialize, so
+# they are imported inside the emitters that need them; runs that never
+# touch a given format skip that startup tax entirely
 
 logger = logging.getLogger(__name__)
 
+# Markdown line classifiers dispatched on the first character: one dict
+# lookup picks the handler instead of trying each pattern in turn.
+# Handlers take a stripped, non-empty line and return a (kind, text)
+# token, falling back to a body paragraph when the shape does not hold.
+
+
+def _classify_heading(line: str) -> tuple:
+    level = len(line) - len(line.lstrip('#'))
+    if level <= 4 and len(line) > level and line[level].isspace():
+        return (f'h{level}', line[level:].strip())
+    return ('p', line)
+
+
+def _classify_bullet(line: str) -> tuple:
+    if len(line) > 1 and line[1].isspace():
+        return ('ul', line[1:].strip())
+    return ('p', line)
+
+
+def _classify_numbered(line: str) -> tuple:
+    digits = len(line) - len(line.lstrip('0123456789'))
+    after = digits + 1
+    if after < len(line) and line[digits] in '.)' and line[after].isspace():
+        return ('ol', line[after:].strip())
+    return ('p', line)
+
+
+_MD_DISPATCH = {'#': _classify_heading, '-': _classify_bullet, '*': _classify_bullet}
+for _digit in '0123456789':
+    _MD_DISPATCH[_digit] = _classify_numbered
+del _digit
+
+
+def _parse_md(content: str) -> list:
+    """
+    Parse markdown into a flat token list shared by all output backends
+
+    Each token is a (kind, text) tuple where kind is one of 'h1'-'h4',
+    'ul', 'ol', 'p' or 'blank'.
+
+    Args:
+        content: Markdown content
+
+    Returns:
+        List of (kind, text) tokens
+    """
+    tokens = []
+    dispatch = _MD_DISPATCH
+
+    for line in content.splitlines():
+        line = line.strip()
+
+        if not line:
+            tokens.append(('blank', ''))
+            continue
+
+        handler = dispatch.get(line[0])
+        tokens.append(handler(line) if handler else ('p', line))
+
+    return tokens
+
+
+# Token kind -> built-in Word style id used when constructing paragraph
+# XML directly; 'p' and 'blank' use the default style
+_DOCX_STYLES = {
+    'h1': 'Heading1', 'h2': 'Heading2', 'h3': 'Heading3', 'h4': 'Heading4',
+    'ul': 'ListBullet', 'ol': 'ListNumber',
+}
+
+
+def _w_paragraph(text: str, style_id: Optional[str]):
+    """Build a w:p element with an optional paragraph style"""
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    p = OxmlElement('w:p')
+
+    if style_id is not None:
+        p_pr = OxmlElement('w:pPr')
+        p_style = OxmlElement('w:pStyle')
+        p_style.set(qn('w:val'), style_id)
+        p_pr.append(p_style)
+        p.append(p_pr)
+
+    if text:
+        run = OxmlElement('w:r')
+        t = OxmlElement('w:t')
+        t.set(qn('xml:space'), 'preserve')
+        t.text = text
+        run.append(t)
+        p.append(run)
+
+    return p
+
+
+# Shared render pool, created on first use so importing this module does
+# not spawn threads; keeping it module-level lets the workers stay warm
+# across generate_all_formats calls
+_render_pool = None
+
+
+def _get_render_pool() -> ThreadPoolExecutor:
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = ThreadPoolExecutor(max_workers=3,
+                                          thread_name_prefix='render')
+    return _render_pool
+
 
 class DocumentGenerator:
     """Generate documents in various formats"""
@@ -31,7 +134,32 @@ class DocumentGenerator:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Built lazily on first PDF render so constructing a generator
+        # does not pull in reportlab
+        self._styles = None
+
         logger.info(f"Initialized DocumentGenerator with output_dir: {output_dir}")
+
+    @property
+    def _pdf_styles(self):
+        """Reportlab stylesheet, built once on first use
+
+        The stylesheet is input-independent and read-only after
+        construction, which keeps concurrent renders safe.
+        """
+        if self._styles is None:
+            from reportlab.lib.enums import TA_JUSTIFY
+            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+            styles = getSampleStyleSheet()
+            styles.add(ParagraphStyle(
+                name='Justify',
+                parent=styles['BodyText'],
+                alignment=TA_JUSTIFY
+            ))
+            self._styles = styles
+        return self._styles
     
     def save_markdown(self, content: str, filename: str) -> str:
         """
@@ -45,10 +173,12 @@ class DocumentGenerator:
             Path to saved file
         """
         filepath = self.output_dir / f"{filename}.md"
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+
+        # Binary write of the pre-encoded bytes skips the text layer's
+        # incremental encoder
+        with open(filepath, 'wb') as f:
+            f.write(content.encode('utf-8'))
+
         logger.info(f"Saved Markdown to: {filepath}")
         return str(filepath)
     
@@ -63,46 +193,31 @@ class DocumentGenerator:
         Returns:
             Path to saved file
         """
+        return self._emit_docx(_parse_md(markdown_content), filename)
+
+    def _emit_docx(self, tokens: list, filename: str) -> str:
+        """Render a parsed token list to a DOCX file"""
+        from docx import Document
+        from docx.oxml.ns import qn
+
         filepath = self.output_dir / f"{filename}.docx"
-        
+
         # Create document
         doc = Document()
-        
-        # Parse markdown and add to document
-        lines = markdown_content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            if not line:
-                # Empty line - add spacing
-                doc.add_paragraph()
-                continue
-            
-            # Handle headings
-            if line.startswith('# '):
-                heading = doc.add_heading(line[2:], level=1)
-                heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            elif line.startswith('## '):
-                heading = doc.add_heading(line[3:], level=2)
-                heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            elif line.startswith('### '):
-                heading = doc.add_heading(line[4:], level=3)
-                heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            elif line.startswith('#### '):
-                heading = doc.add_heading(line[5:], level=4)
-                heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            # Handle lists
-            elif line.startswith('- ') or line.startswith('* '):
-                doc.add_paragraph(line[2:], style='List Bullet')
-            elif line.startswith('1. ') or line.startswith('2. ') or line.startswith('3. '):
-                # Numbered list
-                text = line.split('. ', 1)[1] if '. ' in line else line
-                doc.add_paragraph(text, style='List Number')
-            # Regular paragraph
-            else:
-                doc.add_paragraph(line)
-        
+
+        # Build the w:p elements directly and splice them into the body
+        # in one pass: add_paragraph walks the XML tree per call, which
+        # dominates for long reviews
+        paragraphs = [_w_paragraph(text, _DOCX_STYLES.get(kind))
+                      for kind, text in tokens]
+
+        body = doc.element.body
+        # Keep the trailing w:sectPr as the last body child
+        sect_pr = body.find(qn('w:sectPr'))
+        for element in paragraphs:
+            body.insert(len(body) - 1 if sect_pr is not None else len(body),
+                        element)
+
         # Save document
         doc.save(filepath)
         logger.info(f"Saved DOCX to: {filepath}")
@@ -119,8 +234,15 @@ class DocumentGenerator:
         Returns:
             Path to saved file
         """
+        return self._emit_pdf(_parse_md(markdown_content), filename)
+
+    def _emit_pdf(self, tokens: list, filename: str) -> str:
+        """Render a parsed token list to a PDF file"""
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
         filepath = self.output_dir / f"{filename}.pdf"
-        
+
         # Create PDF
         doc = SimpleDocTemplate(
             str(filepath),
@@ -130,55 +252,39 @@ class DocumentGenerator:
             topMargin=72,
             bottomMargin=18
         )
-        
+
         # Container for the 'Flowable' objects
         elements = []
-        
-        # Define styles
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(
-            name='Justify',
-            parent=styles['BodyText'],
-            alignment=TA_JUSTIFY
-        ))
-        
-        # Parse markdown and add to PDF
-        lines = markdown_content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            if not line:
+
+        styles = self._pdf_styles
+
+        # Consecutive body lines are coalesced into one flowable:
+        # reportlab layout cost scales with flowable count, and joined
+        # lines reflow as a natural paragraph
+        body_buf = []
+
+        def flush_body():
+            if body_buf:
+                elements.append(Paragraph(' '.join(body_buf), styles['Justify']))
                 elements.append(Spacer(1, 12))
+                body_buf.clear()
+
+        for kind, text in tokens:
+            if kind == 'p':
+                body_buf.append(text)
                 continue
-            
-            # Handle headings
-            if line.startswith('# '):
-                p = Paragraph(line[2:], styles['Heading1'])
-                elements.append(p)
-                elements.append(Spacer(1, 12))
-            elif line.startswith('## '):
-                p = Paragraph(line[3:], styles['Heading2'])
-                elements.append(p)
-                elements.append(Spacer(1, 12))
-            elif line.startswith('### '):
-                p = Paragraph(line[4:], styles['Heading3'])
-                elements.append(p)
+            flush_body()
+            if kind == 'blank':
                 elements.append(Spacer(1, 12))
-            # Handle lists
-            elif line.startswith('- ') or line.startswith('* '):
-                p = Paragraph(f"• {line[2:]}", styles['BodyText'])
-                elements.append(p)
-            elif line.startswith('1. ') or line.startswith('2. ') or line.startswith('3. '):
-                text = line.split('. ', 1)[1] if '. ' in line else line
-                p = Paragraph(text, styles['BodyText'])
-                elements.append(p)
-            # Regular paragraph
-            else:
-                p = Paragraph(line, styles['Justify'])
-                elements.append(p)
+            elif kind[0] == 'h':
+                elements.append(Paragraph(text, styles[f'Heading{kind[1]}']))
                 elements.append(Spacer(1, 12))
-        
+            elif kind == 'ul':
+                elements.append(Paragraph(f"• {text}", styles['BodyText']))
+            elif kind == 'ol':
+                elements.append(Paragraph(text, styles['BodyText']))
+        flush_body()
+
         # Build PDF
         doc.build(elements)
         logger.info(f"Saved PDF to: {filepath}")
@@ -195,11 +301,23 @@ class DocumentGenerator:
         Returns:
             Dictionary with paths to all generated files
         """
-        result = {
-            'md': self.save_markdown(markdown_content, filename),
-            'docx': self.markdown_to_docx(markdown_content, filename),
-            'pdf': self.markdown_to_pdf(markdown_content, filename)
+        # Parse once; the DOCX and PDF emitters share the token list so
+        # the content is not re-scanned per format
+        tokens = _parse_md(markdown_content)
+
+        # The three renderers are independent, so run them concurrently;
+        # python-docx and reportlab spend much of their time in zlib and
+        # file I/O, which release the GIL
+        renderers = {
+            'md': (self.save_markdown, markdown_content),
+            'docx': (self._emit_docx, tokens),
+            'pdf': (self._emit_pdf, tokens)
         }
-        
+
+        executor = _get_render_pool()
+        futures = {fmt: executor.submit(render, source, filename)
+                   for fmt, (render, source) in renderers.items()}
+        result = {fmt: future.result() for fmt, future in futures.items()}
+
         logger.info(f"Generated all formats for: {filename}")
         return result
@@ -3,15 +3,49 @@ Gemini API client for interacting with Google's Gemini models
 """
 
 import os
+import hashlib
 import logging
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional, Dict, Any
-import google.generativeai as genai
 from dotenv import load_dotenv
 
+from .cache import _atomic_write
+
+# google.generativeai is the heaviest import in the package; it is
+# pulled in lazily inside the functions that talk to the API so cache
+# hits and non-AI code paths skip it
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Raw response cache. Opt-in via TASK_AGENT_RESPONSE_CACHE=1 (its own
+# knob, separate from the default-on TASK_AGENT_CACHE result memoization
+# in cache.py): generation is sampled, so replaying cached responses is
+# only wanted when the caller explicitly asks for deterministic repeat
+# runs (dev loops, demos)
+_RESPONSE_CACHE_DIR = Path("output/cache/gemini")
+
+
+def _response_cache_enabled() -> bool:
+    return os.getenv("TASK_AGENT_RESPONSE_CACHE") == "1"
+
+
+@lru_cache(maxsize=4)
+def _get_model(api_key: str, model_name: str):
+    """
+    Build (or reuse) a GenerativeModel for the given key and model
+
+    Model construction sets up auth and transport state; caching it lets
+    every client with the same credentials share one instance instead of
+    paying the setup cost per TaskAgent.
+    """
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
 
 class GeminiClient:
     """Client for interacting with Gemini API"""
@@ -29,8 +63,7 @@ class GeminiClient:
             raise ValueError("Gemini API key not provided. Set GEMINI_API_KEY environment variable.")
         
         self.model_name = model
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(self.model_name)
+        self.model = _get_model(self.api_key, self.model_name)
         logger.info(f"Initialized Gemini client with model: {self.model_name}")
     
     def generate(self, prompt: str, temperature: float = 0.7, max_tokens: int = 4096) -> str:
@@ -45,28 +78,82 @@ class GeminiClient:
         Returns:
             Generated text
         """
+        cache_path = None
+        if _response_cache_enabled():
+            key = hashlib.sha256(
+                f'{self.model_name}|{temperature}|{max_tokens}|{prompt}'.encode('utf-8')
+            ).hexdigest()
+            cache_path = _RESPONSE_CACHE_DIR / f"{key}.txt"
+            if cache_path.exists():
+                logger.debug(f"Response cache hit for prompt hash {key[:12]}")
+                return cache_path.read_text(encoding='utf-8')
+
         try:
+            import google.generativeai as genai
+
             generation_config = genai.types.GenerationConfig(
                 temperature=temperature,
                 max_output_tokens=max_tokens
             )
-            
+
             response = self.model.generate_content(
                 prompt,
                 generation_config=generation_config
             )
-            
+
             if not response.text:
                 logger.error("Empty response from Gemini API")
                 raise ValueError("Empty response from Gemini API")
-            
+
             logger.debug(f"Generated {len(response.text)} characters")
+
+            if cache_path is not None:
+                _RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                _atomic_write(cache_path, response.text)
+
             return response.text
-            
+
         except Exception as e:
             logger.error(f"Error generating content: {str(e)}")
             raise
-    
+
+    def generate_stream(self, prompt: str, temperature: float = 0.7, max_tokens: int = 4096):
+        """
+        Generate text using Gemini API, yielding chunks as they arrive
+
+        Lets callers overlap parsing with the network receive instead of
+        waiting for the full response to materialize.
+
+        Args:
+            prompt: Input prompt
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Text chunks as the API produces them
+        """
+        try:
+            import google.generativeai as genai
+
+            generation_config = genai.types.GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens
+            )
+
+            response = self.model.generate_content(
+                prompt,
+                generation_config=generation_config,
+                stream=True
+            )
+
+            for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+
+        except Exception as e:
+            logger.error(f"Error generating content: {str(e)}")
+            raise
+
     def chat(self, messages: list, temperature: float = 0.7) -> str:
         """
         Have a conversation with Gemini
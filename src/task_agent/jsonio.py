@@ -0,0 +1,56 @@
+"""
+JSON serialization helpers with optional fast backends
+"""
+
+import json as _stdlib_json
+
+try:
+    import msgspec.json as _msgspec_json
+except ImportError:
+    _msgspec_json = None
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def dumps_bytes(obj, pretty: bool = True) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes
+
+    Prefers msgspec, then orjson (both C-level encoders emitting bytes
+    directly), falling back to the stdlib encoder otherwise.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent the output for readability
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if _msgspec_json is not None:
+        encoded = _msgspec_json.encode(obj)
+        return _msgspec_json.format(encoded, indent=2) if pretty else encoded
+    if _orjson is not None:
+        option = _orjson.OPT_INDENT_2 if pretty else 0
+        return _orjson.dumps(obj, option=option)
+    indent = 2 if pretty else None
+    return _stdlib_json.dumps(obj, indent=indent, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data):
+    """
+    Parse JSON from bytes or str with the fastest available backend
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed object
+    """
+    if _msgspec_json is not None:
+        return _msgspec_json.decode(data)
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return _stdlib_json.loads(data)
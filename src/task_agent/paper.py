@@ -3,17 +3,23 @@ Paper processing and management
 """
 
 import os
-import json
+import re
+import gzip
+import atexit
+import hashlib
 import logging
+import weakref
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 
+from . import jsonio
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Represents a research paper"""
     title: str
@@ -26,10 +32,26 @@ class Paper:
     summary: Optional[str] = None
     key_findings: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    
+    # Memoized to_dict payload; any public field write clears it
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_dict_cache', None)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert paper to dictionary"""
-        return {
+        """Convert paper to dictionary
+
+        The payload is memoized between field writes, so re-saving an
+        unchanged collection rebuilds nothing; list and dict fields stay
+        visible through the cache since they are held by reference.
+        """
+        cached = self._dict_cache
+        if cached is not None:
+            return cached
+
+        payload = {
             'title': self.title,
             'authors': self.authors,
             'year': self.year,
@@ -41,61 +63,265 @@ class Paper:
             'key_findings': self.key_findings,
             'metadata': self.metadata
         }
+        object.__setattr__(self, '_dict_cache', payload)
+        return payload
     
+    def add_author(self, name: str):
+        """Add an author, keeping the list deduplicated in insertion order"""
+        if name not in self.authors:
+            self.authors = self.authors + [name]
+
+    def add_keyword(self, keyword: str):
+        """Add a keyword, keeping the list deduplicated in insertion order"""
+        if keyword not in self.keywords:
+            self.keywords = self.keywords + [keyword]
+
+    def content_key(self) -> str:
+        """Stable hash of the paper's identifying content"""
+        content = f"{self.title}\x00{self.abstract or ''}"
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Paper':
-        """Create paper from dictionary"""
-        return cls(**data)
+        """Create paper from dictionary
+
+        Unknown keys (e.g. from metadata written by a newer version) are
+        dropped instead of raising, and missing keys fall back to the
+        field defaults.
+        """
+        return cls(**{k: v for k, v in data.items() if k in _PAPER_FIELDS})
+
+
+# Accepted from_dict keys, precomputed once; private bookkeeping fields
+# are excluded so stale cache keys in stored data cannot leak in
+_PAPER_FIELDS = frozenset(
+    f.name for f in fields(Paper) if not f.name.startswith('_'))
 
 
 class PaperManager:
     """Manage research papers"""
     
-    def __init__(self, papers_dir: str = "output/papers"):
+    def __init__(self, papers_dir: str = "output/papers", auto_save: bool = True):
         """
         Initialize paper manager
-        
+
         Args:
             papers_dir: Directory to store papers and metadata
+            auto_save: Persist after every mutation; pass False (or use
+                the manager as a context manager) to batch writes into
+                one save
         """
         self.papers_dir = Path(papers_dir)
         self.papers_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_file = self.papers_dir / "papers_metadata.json"
+        self.log_file = self.papers_dir / "papers_metadata.jsonl"
         self.papers: List[Paper] = []
-        
+        self.auto_save = auto_save
+        self._dirty = False
+        self._pending_log = 0
+        self._log_handle = None
+
+        # Columnar index kept in sync with self.papers so filtering and
+        # ranking scan compact arrays instead of walking Paper objects
+        self._titles: List[str] = []
+        self._years: List[Optional[int]] = []
+        self._keyword_sets: List[frozenset] = []
+        self._token_sets: List[frozenset] = []
+        self._content_keys: set = set()
+        self._by_title: Dict[str, Paper] = {}
+
         # Load existing papers
         self._load_metadata()
         logger.info(f"Initialized PaperManager with {len(self.papers)} papers")
+
+        # Fold the append log back into the snapshot at shutdown
+        atexit.register(PaperManager._compact_at_exit, weakref.ref(self))
+
+    @staticmethod
+    def _compact_at_exit(manager_ref):
+        """Compact a still-live manager when the process exits"""
+        manager = manager_ref()
+        if manager is not None and (manager._pending_log or manager._dirty):
+            manager.compact()
+
+    def _index_paper(self, paper: Paper):
+        """Append a paper's searchable fields to the columnar index"""
+        self._titles.append(paper.title.lower())
+        self._years.append(paper.year)
+        self._keyword_sets.append(
+            frozenset(kw.lower() for kw in paper.keywords))
+        tokens = re.findall(r'\w+', paper.title.lower())
+        for keyword in paper.keywords:
+            tokens.extend(re.findall(r'\w+', keyword.lower()))
+        self._token_sets.append(frozenset(tokens))
+        self._content_keys.add(paper.content_key())
+        self._by_title[paper.title.lower()] = paper
+
+    def _rebuild_index(self):
+        """Rebuild the columnar index from the paper list"""
+        self._titles = []
+        self._years = []
+        self._keyword_sets = []
+        self._token_sets = []
+        self._content_keys = set()
+        self._by_title = {}
+        for paper in self.papers:
+            self._index_paper(paper)
     
+    def _add_loaded(self, paper: Paper):
+        """Register a freshly deserialized paper and index it in one step"""
+        self.papers.append(paper)
+        self._index_paper(paper)
+
     def _load_metadata(self):
-        """Load papers metadata from JSON file"""
+        """Load papers metadata from the snapshot file plus the append log
+
+        Papers are appended and indexed in the same pass, so loading is
+        one walk over the decoded entries instead of building the list
+        first and re-scanning it to index.
+        """
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                self.papers = [Paper.from_dict(p) for p in data]
+                with open(self.metadata_file, 'rb') as f:
+                    data = jsonio.loads(f.read())
+                for entry in data:
+                    self._add_loaded(Paper.from_dict(entry))
                 logger.info(f"Loaded {len(self.papers)} papers from metadata")
             except Exception as e:
                 logger.error(f"Error loading papers metadata: {e}")
                 self.papers = []
+                self._rebuild_index()
+
+        # Replay papers appended since the last compaction
+        if self.log_file.exists():
+            try:
+                with open(self.log_file, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            self._add_loaded(Paper.from_dict(jsonio.loads(line)))
+                            self._pending_log += 1
+            except Exception as e:
+                logger.error(f"Error replaying papers log: {e}")
+
+    def _append_log(self, papers: List[Paper]):
+        """Append papers to the metadata log in one buffered write
+
+        The log handle stays open across calls so repeated adds pay one
+        buffered write each instead of an open/close cycle; data reaches
+        the OS on each batch, and flush() forces it to the device.
+        """
+        try:
+            if self._log_handle is None:
+                self._log_handle = open(self.log_file, 'ab')
+            for paper in papers:
+                self._log_handle.write(
+                    jsonio.dumps_bytes(paper.to_dict(), pretty=False) + b"\n")
+            self._log_handle.flush()
+            self._pending_log += len(papers)
+        except Exception as e:
+            logger.error(f"Error appending to papers log: {e}")
+
+    def flush(self):
+        """Force appended log entries all the way to the device"""
+        if self._log_handle is not None:
+            self._log_handle.flush()
+            os.fsync(self._log_handle.fileno())
+
+    def _close_log(self):
+        if self._log_handle is not None:
+            try:
+                self._log_handle.close()
+            except OSError as e:
+                logger.error(f"Error closing papers log: {e}")
+            self._log_handle = None
+
+    def compact(self):
+        """Merge the append log back into the snapshot metadata file"""
+        if not self.papers_dir.exists():
+            self._close_log()
+            return
+        self._save_metadata()
+        self._close_log()
+        try:
+            self.log_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"Error removing papers log: {e}")
+        self._pending_log = 0
     
     def _save_metadata(self):
         """Save papers metadata to JSON file"""
         try:
             data = [paper.to_dict() for paper in self.papers]
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Compact form: nothing reads this file by hand, and indented
+            # output is both larger and slower to encode
+            with open(self.metadata_file, 'wb') as f:
+                f.write(jsonio.dumps_bytes(data, pretty=False))
             logger.info(f"Saved {len(self.papers)} papers to metadata")
         except Exception as e:
             logger.error(f"Error saving papers metadata: {e}")
     
     def add_paper(self, paper: Paper):
-        """Add a paper to the collection"""
+        """Add a paper to the collection (no-op for known content)"""
+        if paper.content_key() in self._content_keys:
+            logger.info(f"Skipping duplicate paper: {paper.title}")
+            return
         self.papers.append(paper)
-        self._save_metadata()
+        self._index_paper(paper)
+        self._persist_added([paper])
         logger.info(f"Added paper: {paper.title}")
+
+    def _persist_added(self, papers: List[Paper]):
+        """Persist newly added papers: O(1) log append after first snapshot"""
+        if not self.auto_save:
+            self._dirty = True
+            return
+        if self.metadata_file.exists():
+            self._append_log(papers)
+        else:
+            self.compact()
+
+    def __enter__(self) -> 'PaperManager':
+        """Suppress per-mutation saves for the duration of the block"""
+        self._saved_auto_save = self.auto_save
+        self.auto_save = False
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.auto_save = self._saved_auto_save
+        if self._dirty:
+            self.compact()
+            self._dirty = False
+        return False
     
-    def add_paper_from_file(self, filepath: str, title: str, 
+    def add_papers(self, papers: List[Paper]):
+        """
+        Add a batch of papers to the collection
+
+        The metadata file is written once for the whole batch instead of
+        once per paper, so bulk imports cost a single save.
+
+        Args:
+            papers: Papers to add
+        """
+        new_papers = []
+        for paper in papers:
+            key = paper.content_key()
+            if key in self._content_keys:
+                continue
+            self._content_keys.add(key)
+            new_papers.append(paper)
+        if len(new_papers) < len(papers):
+            logger.info(f"Skipping {len(papers) - len(new_papers)} duplicate papers")
+        if not new_papers:
+            return
+        self.papers.extend(new_papers)
+        for paper in new_papers:
+            self._index_paper(paper)
+        self._persist_added(new_papers)
+        logger.info(f"Added {len(new_papers)} papers")
+
+    def add_paper_from_file(self, filepath: str, title: str,
                            authors: List[str] = None, **kwargs) -> Paper:
         """
         Add a paper from a file
@@ -119,16 +345,69 @@ class PaperManager:
         return paper
     
     def get_paper_by_title(self, title: str) -> Optional[Paper]:
-        """Get paper by title"""
-        for paper in self.papers:
-            if paper.title.lower() == title.lower():
-                return paper
-        return None
+        """Get paper by title (O(1) via the lowercased title index)"""
+        return self._by_title.get(title.lower())
     
     def list_papers(self) -> List[Paper]:
         """Get all papers"""
         return self.papers
+
+    def filter_papers(self, keyword: Optional[str] = None,
+                      year: Optional[int] = None) -> List[Paper]:
+        """
+        Filter papers by keyword and/or publication year
+
+        The scan runs over the columnar index rather than Paper objects,
+        so no per-paper attribute lookups or lowercasing happen per call.
+
+        Args:
+            keyword: Keyword to match (case-insensitive)
+            year: Publication year to match
+
+        Returns:
+            Matching papers
+        """
+        keyword = keyword.lower() if keyword else None
+        results = []
+
+        for i, paper in enumerate(self.papers):
+            if keyword is not None and keyword not in self._keyword_sets[i]:
+                continue
+            if year is not None and self._years[i] != year:
+                continue
+            results.append(paper)
+
+        return results
     
+    def rank_papers(self, query: str, top_k: int = 5) -> List[Paper]:
+        """
+        Rank papers by relevance to a query string
+
+        Scoring intersects the query tokens with each paper's precomputed
+        title/keyword token set from the columnar index, so ranking is a
+        single pass of C-level set intersections with no per-paper string
+        processing.
+
+        Args:
+            query: Free-text query (e.g. a review topic)
+            top_k: Maximum number of papers to return
+
+        Returns:
+            Papers sorted by descending relevance, best first
+        """
+        query_tokens = frozenset(re.findall(r'\w+', query.lower()))
+        if not query_tokens:
+            return []
+
+        scored = []
+        for i, tokens in enumerate(self._token_sets):
+            score = len(tokens & query_tokens)
+            if score:
+                scored.append((score, i))
+
+        scored.sort(key=lambda item: -item[0])
+        return [self.papers[i] for _, i in scored[:top_k]]
+
     def update_paper_summary(self, title: str, summary: str, key_findings: List[str] = None):
         """Update paper summary and key findings"""
         paper = self.get_paper_by_title(title)
@@ -136,44 +415,65 @@ class PaperManager:
             paper.summary = summary
             if key_findings:
                 paper.key_findings = key_findings
-            self._save_metadata()
+            # In-place mutation invalidates logged entries, so rewrite
+            if self.auto_save:
+                self.compact()
+            else:
+                self._dirty = True
             logger.info(f"Updated summary for paper: {title}")
     
     def generate_papers_summary(self) -> str:
         """Generate a summary of all papers"""
         if not self.papers:
             return "No papers available."
-        
-        summary = "# Papers Summary\n\n"
-        
+
+        # Build via list + join: linear time, unlike += in a loop; one
+        # extend per paper keeps the per-block append overhead down
+        parts = ["# Papers Summary\n\n"]
+
         for i, paper in enumerate(self.papers, 1):
-            summary += f"## {i}. {paper.title}\n\n"
-            
+            block = [f"## {i}. {paper.title}\n\n"]
+
             if paper.authors:
-                summary += f"**Authors:** {', '.join(paper.authors)}\n\n"
-            
+                block.append(f"**Authors:** {', '.join(paper.authors)}\n\n")
+
             if paper.year:
-                summary += f"**Year:** {paper.year}\n\n"
-            
+                block.append(f"**Year:** {paper.year}\n\n")
+
             if paper.abstract:
-                summary += f"**Abstract:** {paper.abstract}\n\n"
-            
+                block.append(f"**Abstract:** {paper.abstract}\n\n")
+
             if paper.summary:
-                summary += f"**Summary:** {paper.summary}\n\n"
-            
+                block.append(f"**Summary:** {paper.summary}\n\n")
+
             if paper.key_findings:
-                summary += "**Key Findings:**\n"
-                for finding in paper.key_findings:
-                    summary += f"- {finding}\n"
-                summary += "\n"
-            
-            summary += "---\n\n"
-        
-        return summary
+                findings = "".join(f"- {finding}\n"
+                                   for finding in paper.key_findings)
+                block.append(f"**Key Findings:**\n{findings}\n")
+
+            block.append("---\n\n")
+            parts.extend(block)
+
+        return "".join(parts)
     
-    def export_metadata(self, filepath: str):
-        """Export papers metadata to a custom file"""
-        data = [paper.to_dict() for paper in self.papers]
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def export_metadata(self, filepath: str, compress: bool = False):
+        """Export papers metadata to a custom file
+
+        Exports are meant for humans, so they stay indented; pass
+        compress=True to gzip the output (a .gz suffix is added if the
+        path has none).
+
+        Args:
+            filepath: Destination path
+            compress: Write gzip-compressed JSON
+        """
+        data = jsonio.dumps_bytes([paper.to_dict() for paper in self.papers])
+        if compress:
+            if not filepath.endswith('.gz'):
+                filepath += '.gz'
+            with gzip.open(filepath, 'wb', compresslevel=1) as f:
+                f.write(data)
+        else:
+            with open(filepath, 'wb') as f:
+                f.write(data)
         logger.info(f"Exported papers metadata to: {filepath}")
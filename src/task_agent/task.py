@@ -2,11 +2,13 @@
 Task data structures and state management
 """
 
+import threading
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import json
+
+from . import jsonio
 
 
 class TaskStatus(Enum):
@@ -18,7 +20,25 @@ class TaskStatus(Enum):
     WAITING_USER = "waiting_user"
 
 
-@dataclass
+# Precomputed status -> label map so hot loops skip the Enum.value
+# descriptor lookup on every access
+STATUS_LABELS = {status: status.value for status in TaskStatus}
+
+# Reverse map for deserialization: one dict probe instead of the Enum
+# metaclass __call__ and its member search
+_STR_TO_STATUS = {status.value: status for status in TaskStatus}
+
+# Bounded pool of Task shells reused by from_dict; long-running agents
+# that load and discard workflows repeatedly skip the allocator churn
+_TASK_POOL: List['Task'] = []
+_TASK_POOL_MAX = 256
+
+# Module-level alias for the completion scans: enum members are
+# singletons, so 'is' against a local constant beats == dispatch
+_DONE = TaskStatus.COMPLETED
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a single task in the workflow"""
     id: str
@@ -26,34 +46,128 @@ class Task:
     description: str
     status: TaskStatus = TaskStatus.PENDING
     result: Optional[str] = None
+    result_preview: Optional[str] = None
+    result_path: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
+    dependencies: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    
+    _workflow: Optional['Workflow'] = field(default=None, repr=False, compare=False)
+    # Memoized isoformat strings; cleared when the datetime they mirror
+    # is reassigned
+    _created_at_iso: Optional[str] = field(default=None, repr=False, compare=False)
+    _completed_at_iso: Optional[str] = field(default=None, repr=False, compare=False)
+    # Memoized to_dict payload; any public field write clears it
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name == 'status':
+            # Keep the owning workflow's completion counter in step with
+            # status transitions
+            old = getattr(self, 'status', None)
+            object.__setattr__(self, name, value)
+            object.__setattr__(self, '_dict_cache', None)
+            workflow = getattr(self, '_workflow', None)
+            if workflow is not None and old is not value:
+                # Batches run on a thread pool, so the read-modify-write
+                # must be serialized against sibling tasks
+                with workflow._lock:
+                    if old is _DONE:
+                        workflow._completed_count -= 1
+                    if value is _DONE:
+                        workflow._completed_count += 1
+            return
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_dict_cache', None)
+        if name == 'created_at':
+            object.__setattr__(self, '_created_at_iso', None)
+        elif name == 'completed_at':
+            object.__setattr__(self, '_completed_at_iso', None)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert task to dictionary"""
-        return {
+        """Convert task to dictionary
+
+        The payload is memoized between field writes. Values that are
+        held by reference (dependencies, metadata) stay visible through
+        the cached dict even when mutated in place.
+        """
+        cached = self._dict_cache
+        if cached is not None:
+            return cached
+
+        created_iso = self._created_at_iso
+        if created_iso is None:
+            created_iso = self.created_at.isoformat()
+            object.__setattr__(self, '_created_at_iso', created_iso)
+
+        completed_iso = self._completed_at_iso
+        if completed_iso is None and self.completed_at is not None:
+            completed_iso = self.completed_at.isoformat()
+            object.__setattr__(self, '_completed_at_iso', completed_iso)
+
+        payload = {
             'id': self.id,
             'title': self.title,
             'description': self.description,
-            'status': self.status.value,
+            'status': STATUS_LABELS[self.status],
             'result': self.result,
-            'created_at': self.created_at.isoformat(),
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'result_preview': self.result_preview,
+            'result_path': self.result_path,
+            'created_at': created_iso,
+            'completed_at': completed_iso,
+            'dependencies': self.dependencies,
             'metadata': self.metadata
         }
-    
+        object.__setattr__(self, '_dict_cache', payload)
+        return payload
+
+    def _reset(self, **data) -> 'Task':
+        """Reinitialize a pooled instance as if freshly constructed"""
+        # Detach first so the status write below cannot touch the
+        # counter of a workflow this shell used to belong to
+        object.__setattr__(self, '_workflow', None)
+        self.id = data['id']
+        self.title = data['title']
+        self.description = data['description']
+        self.status = data.get('status', TaskStatus.PENDING)
+        self.result = data.get('result')
+        self.result_preview = data.get('result_preview')
+        self.result_path = data.get('result_path')
+        self.created_at = data.get('created_at') or datetime.now()
+        self.completed_at = data.get('completed_at')
+        self.dependencies = data.get('dependencies') or []
+        self.metadata = data.get('metadata') or {}
+        return self
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
         """Create task from dictionary"""
-        data['status'] = TaskStatus(data['status'])
-        data['created_at'] = datetime.fromisoformat(data['created_at'])
-        if data['completed_at']:
-            data['completed_at'] = datetime.fromisoformat(data['completed_at'])
-        return cls(**data)
+        # Work on a shallow copy so the caller's dict is left untouched,
+        # and only convert values that are still raw strings
+        data = {**data}
+        created_raw = data['created_at']
+        completed_raw = data.get('completed_at')
+        if not isinstance(data['status'], TaskStatus):
+            data['status'] = _STR_TO_STATUS[data['status']]
+        if isinstance(created_raw, str):
+            data['created_at'] = datetime.fromisoformat(created_raw)
+        if isinstance(completed_raw, str):
+            data['completed_at'] = datetime.fromisoformat(completed_raw)
+        data.setdefault('dependencies', [])
+        data.setdefault('result_preview', None)
+        data.setdefault('result_path', None)
+        task = _TASK_POOL.pop()._reset(**data) if _TASK_POOL else cls(**data)
+        # Seed the isoformat caches from the raw strings so a load/save
+        # round trip skips re-formatting
+        if isinstance(created_raw, str):
+            object.__setattr__(task, '_created_at_iso', created_raw)
+        if isinstance(completed_raw, str):
+            object.__setattr__(task, '_completed_at_iso', completed_raw)
+        return task
 
 
-@dataclass
+@dataclass(slots=True)
 class Workflow:
     """Represents a complete workflow with multiple tasks"""
     id: str
@@ -63,27 +177,130 @@ class Workflow:
     current_task_index: int = 0
     created_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    
+    _completed_count: int = field(default=0, repr=False, compare=False)
+    # Cached task count; only add_task and close grow or shrink the list
+    _n_tasks: int = field(default=0, repr=False, compare=False)
+    # Serializes _completed_count updates when task statuses flip from
+    # worker threads during batched execution
+    _lock: threading.Lock = field(default_factory=threading.Lock,
+                                  repr=False, compare=False)
+
+    def __post_init__(self):
+        # Back-reference so task status changes update our counter,
+        # which is recounted once here for pre-populated task lists
+        for task in self.tasks:
+            task._workflow = self
+        self._completed_count = sum(
+            task.status is _DONE for task in self.tasks)
+        self._n_tasks = len(self.tasks)
+
     def add_task(self, task: Task):
         """Add a task to the workflow"""
+        task._workflow = self
         self.tasks.append(task)
-    
+        self._n_tasks += 1
+        if task.status is _DONE:
+            self._completed_count += 1
+
     def get_current_task(self) -> Optional[Task]:
         """Get the current task"""
-        if 0 <= self.current_task_index < len(self.tasks):
+        if 0 <= self.current_task_index < self._n_tasks:
             return self.tasks[self.current_task_index]
         return None
-    
+
     def next_task(self) -> bool:
         """Move to next task, return True if successful"""
-        if self.current_task_index < len(self.tasks) - 1:
+        if self.current_task_index + 1 < self._n_tasks:
             self.current_task_index += 1
             return True
         return False
-    
+
+    def close(self):
+        """Release this workflow's tasks back to the reuse pool"""
+        for task in self.tasks:
+            object.__setattr__(task, '_workflow', None)
+            if len(_TASK_POOL) < _TASK_POOL_MAX:
+                _TASK_POOL.append(task)
+        self.tasks = []
+        self._completed_count = 0
+        self._n_tasks = 0
+
     def is_complete(self) -> bool:
-        """Check if all tasks are completed"""
-        return all(task.status == TaskStatus.COMPLETED for task in self.tasks)
+        """Check if all tasks are completed (O(1) via the counter)"""
+        return self._completed_count == self._n_tasks
+
+    def bottom_levels(self) -> Dict[str, int]:
+        """
+        Compute each task's bottom level: the longest chain of dependent
+        tasks below it, itself included
+
+        Tasks with deep dependent chains sit on the critical path, so
+        schedulers should start them first.
+
+        Returns:
+            Mapping of task id to bottom level
+        """
+        dependents: Dict[str, List[str]] = {task.id: [] for task in self.tasks}
+        for task in self.tasks:
+            for dep in task.dependencies:
+                if dep in dependents:
+                    dependents[dep].append(task.id)
+
+        levels: Dict[str, int] = {}
+
+        def level(task_id: str, visiting: set) -> int:
+            if task_id in levels:
+                return levels[task_id]
+            if task_id in visiting:
+                return 0  # cycle - treat the back edge as absent
+            visiting.add(task_id)
+            below = max((level(d, visiting) for d in dependents[task_id]),
+                        default=0)
+            visiting.discard(task_id)
+            levels[task_id] = below + 1
+            return levels[task_id]
+
+        for task in self.tasks:
+            level(task.id, set())
+        return levels
+
+    def execution_batches(self) -> List[List[Task]]:
+        """
+        Group tasks into batches that can run concurrently
+
+        Tasks in the same batch have no dependencies on each other, so they
+        can be dispatched in parallel. If no task declares dependencies the
+        workflow is treated as strictly sequential (one task per batch) to
+        preserve insertion-order semantics.
+
+        Returns:
+            List of task batches in execution order
+        """
+        if not any(task.dependencies for task in self.tasks):
+            return [[task] for task in self.tasks]
+
+        bottom = self.bottom_levels()
+        by_id = {task.id: task for task in self.tasks}
+        remaining = dict(by_id)
+        done: set = set()
+        batches = []
+
+        while remaining:
+            ready = [task for task in remaining.values()
+                     if all(dep in done or dep not in by_id
+                            for dep in task.dependencies)]
+            if not ready:
+                # Cycle or unknown dependency - fall back to insertion order
+                ready = list(remaining.values())
+            # Critical-path first: deepest dependent chain leads the batch
+            # so limited workers start the longest work earliest
+            ready.sort(key=lambda task: bottom[task.id], reverse=True)
+            for task in ready:
+                del remaining[task.id]
+            done.update(task.id for task in ready)
+            batches.append(ready)
+
+        return batches
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert workflow to dictionary"""
@@ -99,15 +316,17 @@ class Workflow:
     
     def save(self, filepath: str):
         """Save workflow to JSON file"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        # Compact form: the file is only read back by Workflow.load
+        with open(filepath, 'wb') as f:
+            f.write(jsonio.dumps_bytes(self.to_dict(), pretty=False))
     
     @classmethod
     def load(cls, filepath: str) -> 'Workflow':
         """Load workflow from JSON file"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        data['created_at'] = datetime.fromisoformat(data['created_at'])
+        with open(filepath, 'rb') as f:
+            data = jsonio.loads(f.read())
+
+        if isinstance(data['created_at'], str):
+            data['created_at'] = datetime.fromisoformat(data['created_at'])
         data['tasks'] = [Task.from_dict(task_data) for task_data in data['tasks']]
         return cls(**data)
@@ -0,0 +1,131 @@
+"""
+Tests for the on-disk caching utilities
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from task_agent.cache import disk_memoize, SemanticPromptCache
+
+
+@pytest.fixture(scope="module")
+def tmp_root(tmp_path_factory):
+    """Shared scratch directory for this module's tests"""
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(autouse=True)
+def cache_enabled(monkeypatch):
+    """Run every test with the disk cache switched on"""
+    monkeypatch.setenv("TASK_AGENT_CACHE", "1")
+
+
+def test_disk_memoize_hit_and_miss(tmp_root):
+    """Second call with the same arguments is served from disk"""
+    calls = []
+
+    @disk_memoize(cache_dir=str(tmp_root / "hits"))
+    def compute(value):
+        calls.append(value)
+        return value * 2
+
+    assert compute(21) == 42
+    assert compute(21) == 42
+    assert calls == [21]
+
+    # A different argument is a miss
+    assert compute(1) == 2
+    assert calls == [21, 1]
+
+
+def test_disk_memoize_ttl_expiry(tmp_root):
+    """Entries older than the TTL are recomputed"""
+    cache_dir = tmp_root / "ttl"
+    calls = []
+
+    @disk_memoize(cache_dir=str(cache_dir), ttl=60)
+    def compute(value):
+        calls.append(value)
+        return value
+
+    compute("x")
+
+    # Age the entry past the TTL
+    for entry in cache_dir.glob("*.json"):
+        old = os.path.getmtime(entry) - 120
+        os.utime(entry, (old, old))
+
+    compute("x")
+    assert calls == ["x", "x"]
+
+
+def test_disk_memoize_disabled(tmp_root, monkeypatch):
+    """TASK_AGENT_CACHE=0 bypasses the cache entirely"""
+    monkeypatch.setenv("TASK_AGENT_CACHE", "0")
+    calls = []
+
+    @disk_memoize(cache_dir=str(tmp_root / "disabled"))
+    def compute(value):
+        calls.append(value)
+        return value
+
+    compute("x")
+    compute("x")
+    assert calls == ["x", "x"]
+
+
+def test_semantic_prompt_cache_lookup(tmp_root):
+    """Near-duplicate prompts resolve to the stored key, unrelated ones miss"""
+    semantic = SemanticPromptCache(cache_dir=str(tmp_root / "semantic"),
+                                   threshold=0.92)
+    semantic.store("Machine Learning in Healthcare", "key-1")
+
+    assert semantic.lookup("Machine learning in healthcare!") == "key-1"
+    assert semantic.lookup("Quantum computing for cryptography") is None
+
+
+def test_disk_memoize_semantic_hit(tmp_root):
+    """A paraphrased prompt reuses the existing cache entry"""
+    calls = []
+
+    @disk_memoize(cache_dir=str(tmp_root / "paraphrase"),
+                  semantic_threshold=0.92)
+    def compute(prompt):
+        calls.append(prompt)
+        return f"result for {prompt}"
+
+    first = compute("Machine Learning in Healthcare")
+    second = compute("Machine learning in healthcare")
+
+    assert second == first
+    assert calls == ["Machine Learning in Healthcare"]
+
+
+def test_failed_call_is_not_cached(tmp_root):
+    """An exception propagates and leaves no entry behind"""
+    cache_dir = tmp_root / "failure"
+    attempts = []
+
+    @disk_memoize(cache_dir=str(cache_dir))
+    def flaky(value):
+        attempts.append(value)
+        if len(attempts) == 1:
+            raise RuntimeError("transient failure")
+        return value
+
+    with pytest.raises(RuntimeError):
+        flaky("x")
+    assert not list(cache_dir.glob("*.json"))
+
+    # The retry succeeds and is cached normally
+    assert flaky("x") == "x"
+    assert flaky("x") == "x"
+    assert attempts == ["x", "x"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
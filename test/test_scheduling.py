@@ -0,0 +1,137 @@
+"""
+Tests for dependency-aware workflow scheduling
+"""
+
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from task_agent.task import Task, TaskStatus, Workflow
+from task_agent.agent import TaskAgent
+
+
+def _make_workflow(*tasks):
+    workflow = Workflow(id="wf", title="Test", description="Scheduling test")
+    for task in tasks:
+        workflow.add_task(task)
+    return workflow
+
+
+def test_execution_batches_sequential_without_dependencies():
+    """No declared dependencies means strict insertion order, one per batch"""
+    workflow = _make_workflow(
+        Task(id="a", title="A", description="a"),
+        Task(id="b", title="B", description="b"),
+        Task(id="c", title="C", description="c"),
+    )
+
+    batches = workflow.execution_batches()
+    assert [[t.id for t in batch] for batch in batches] == [["a"], ["b"], ["c"]]
+
+
+def test_execution_batches_dependency_ordering():
+    """Independent tasks share a batch; dependents wait for their deps"""
+    workflow = _make_workflow(
+        Task(id="a", title="A", description="a"),
+        Task(id="b", title="B", description="b"),
+        Task(id="c", title="C", description="c", dependencies=["a", "b"]),
+        Task(id="d", title="D", description="d", dependencies=["c"]),
+    )
+
+    batches = workflow.execution_batches()
+    ids = [sorted(t.id for t in batch) for batch in batches]
+    assert ids == [["a", "b"], ["c"], ["d"]]
+
+
+def test_bottom_levels_and_batch_priority():
+    """Tasks with deeper dependent chains lead their batch"""
+    # a <- c <- d forms a chain of three; b has no dependents
+    workflow = _make_workflow(
+        Task(id="a", title="A", description="a"),
+        Task(id="b", title="B", description="b"),
+        Task(id="c", title="C", description="c", dependencies=["a"]),
+        Task(id="d", title="D", description="d", dependencies=["c"]),
+    )
+
+    levels = workflow.bottom_levels()
+    assert levels == {"a": 3, "b": 1, "c": 2, "d": 1}
+
+    # a and b are both ready first; a's longer chain puts it ahead
+    first_batch = workflow.execution_batches()[0]
+    assert [t.id for t in first_batch] == ["a", "b"]
+
+
+def test_execution_batches_cycle_fallback():
+    """A dependency cycle falls back to scheduling every task once"""
+    workflow = _make_workflow(
+        Task(id="a", title="A", description="a", dependencies=["b"]),
+        Task(id="b", title="B", description="b", dependencies=["a"]),
+        Task(id="c", title="C", description="c"),
+    )
+
+    batches = workflow.execution_batches()
+    scheduled = [t.id for batch in batches for t in batch]
+    assert sorted(scheduled) == ["a", "b", "c"]
+    assert len(scheduled) == len(set(scheduled))
+
+
+def test_execution_batches_unknown_dependency():
+    """Dependencies on ids outside the workflow do not block scheduling"""
+    workflow = _make_workflow(
+        Task(id="a", title="A", description="a", dependencies=["ghost"]),
+        Task(id="b", title="B", description="b", dependencies=["a"]),
+    )
+
+    batches = workflow.execution_batches()
+    assert [[t.id for t in batch] for batch in batches] == [["a"], ["b"]]
+
+
+def test_run_workflow_concurrent_batches(tmp_path):
+    """run_workflow dispatches independent tasks together, deps afterwards"""
+    order = []
+    lock = threading.Lock()
+
+    class FakeGemini:
+        model_name = "fake"
+
+        def generate(self, prompt, **kwargs):
+            return "done"
+
+    agent = TaskAgent.__new__(TaskAgent)
+    agent.config = {'output': {'base_dir': str(tmp_path)}}
+    agent.gemini = FakeGemini()
+    agent.current_workflow = None
+
+    workflow = _make_workflow(
+        Task(id="a", title="Step A", description="a"),
+        Task(id="b", title="Step B", description="b"),
+        Task(id="c", title="Step C", description="c", dependencies=["a", "b"]),
+    )
+
+    original = TaskAgent.execute_task
+
+    def tracing_execute(self, task):
+        with lock:
+            order.append(task.id)
+        return original(self, task)
+
+    TaskAgent.execute_task = tracing_execute
+    try:
+        assert agent.run_workflow(workflow) is True
+    finally:
+        TaskAgent.execute_task = original
+
+    # a and b ran in the first batch (either order), c strictly after
+    assert sorted(order[:2]) == ["a", "b"]
+    assert order[2] == "c"
+    assert workflow.is_complete()
+    assert all(t.status == TaskStatus.COMPLETED for t in workflow.tasks)
+    assert (tmp_path / "wf.json").exists()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))